@@ -9,7 +9,6 @@ from typing import Any, Dict, List, Optional
 
 from networkkit.network import ZMQMessageReceiver
 from agentkit.agents.simple_agent_factory import simple_agent_factory
-from networkkit.messages import Message
 
 class AgentManager:
     """
@@ -3,7 +3,6 @@ from typing import Optional, Dict, Any
 from agentkit.agents.base_agent import BaseAgent
 from agentkit.brains.simple_brain import SimpleBrain
 from agentkit.memory.simple_memory import SimpleMemory
-from networkkit.messages import Message, MessageType
 
 # Built-in implementations
 BUILTIN_BRAINS = {
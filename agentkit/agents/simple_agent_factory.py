@@ -3,8 +3,7 @@
 import os
 import importlib
 import logging
-from typing import Dict, Type, Any
-from networkkit.messages import MessageType
+from typing import Dict, Type
 from networkkit.network import HTTPMessageSender
 
 from agentkit.agents.human_agent import HumanAgent
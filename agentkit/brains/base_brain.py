@@ -92,20 +92,20 @@ class BaseBrain(ABC):
         system_role = "system"
         user_role = "user"
         assistant_role = "assistant"
-        
-        messages_prompt = []
-        messages_prompt.append({"role": system_role, "content": system_prompt})
-        
+
         target = self.component_config.message_sender.attention
         context = self.memory_manager.chat_log_for(target=target)
-        
-        for c in context:
-            m = {
-                "content": c.content.strip(), 
-                "role": assistant_role if c.source == self.name else user_role
+
+        name = self.name
+        messages_prompt = [{"role": system_role, "content": system_prompt}]
+        messages_prompt.extend(
+            {
+                "content": c.content.strip(),
+                "role": assistant_role if c.source == name else user_role
             }
-            messages_prompt.append(m)
-        
+            for c in context
+        )
+
         return messages_prompt
     
     def format_response(self, reply: str) -> Message:
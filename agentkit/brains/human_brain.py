@@ -1,8 +1,6 @@
 """Human brain implementation."""
-from typing import Optional
 from agentkit.brains.base_brain import BaseBrain
 from agentkit.memory.memory_protocol import Memory
-from agentkit.common.interfaces import ComponentConfig
 from networkkit.messages import Message
 import logging
 
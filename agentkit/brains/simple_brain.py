@@ -1,6 +1,5 @@
 """Simple brain implementation."""
 from agentkit.brains.base_brain import BaseBrain
-from agentkit.memory.memory_protocol import Memory
 from agentkit.processor import llm_chat
 from networkkit.messages import Message
 import logging
@@ -1,6 +1,4 @@
-import argparse
 import asyncio
-import json
 import logging
 
 # Import modules from agentkit framework
@@ -1,10 +1,6 @@
-from typing import Any, Dict, Protocol
+from typing import Any, Callable, Dict, List, Optional, Protocol
 from pydantic import BaseModel, ValidationError
-from typing import Callable, List
-from typing import Any, Dict, Callable, List, Optional
-from pydantic import BaseModel
 import inspect
-import asyncio
 import json
 from functools import partial
 from agentkit.constants import DEFAULT_LLM_MODEL, FUNCTION_SYSTEM_TEMPLATE, FUNCTION_USER_TEMPLATE
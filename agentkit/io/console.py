@@ -1,5 +1,4 @@
 import asyncio
-import aioconsole
 from networkkit.messages import Message, MessageType
 from rich.console import Console
 from rich.prompt import Prompt
@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from typing import List
-from networkkit.messages import Message, MessageType
+from networkkit.messages import Message
 
 class BaseMemory(ABC):
     """Abstract base class for memory implementations."""
@@ -1,3 +1,5 @@
+from collections import defaultdict, deque
+from typing import Deque, Dict, Iterable, Tuple
 from networkkit.messages import Message, MessageType
 from agentkit.memory.base_memory import BaseMemory
 
@@ -16,26 +18,127 @@ class SimpleMemory(BaseMemory):
 
         Args:
             max_history_length (int, optional): The maximum number of messages to store in the history. Defaults to 10.
+                A value of 0 or less keeps the history unbounded.
         """
 
+        # Each entry pairs a message with the participants it was indexed under, so eviction
+        # removes exactly what remember() added. A bounded deque drops the oldest entry in O(1).
+        self._history: Deque[Tuple[Message, Tuple[str, ...]]] = deque()
+        # CHAT messages indexed by participant (source and recipient), in arrival order
+        self._chat_by_peer: Dict[str, Deque[Message]] = defaultdict(deque)
+        # Applies the limit to the history through the max_history_length setter
         super().__init__(max_history_length)
-        self.history = []
+
+    @property
+    def max_history_length(self) -> int:
+        """The maximum number of messages kept in the history. 0 or less means unbounded."""
+        return self._max_history_length
+
+    @max_history_length.setter
+    def max_history_length(self, value: int) -> None:
+        """
+        Change the history limit, keeping the most recent messages that still fit.
+
+        Args:
+            value (int): The new maximum number of messages. 0 or less keeps the history unbounded.
+        """
+
+        self._max_history_length = value
+        self._rebuild(self.history)
+
+    @property
+    def history(self) -> Tuple[Message, ...]:
+        """
+        Read-only snapshot of the stored messages, oldest first.
+
+        Use `remember` and `clear` to change the history, or assign a sequence of messages
+        to replace it.
+        """
+        return tuple(message for message, _ in self._history)
+
+    @history.setter
+    def history(self, messages: Iterable[Message]) -> None:
+        """
+        Replace the history with the given messages, keeping the most recent ones that fit.
+
+        Args:
+            messages: The messages to store, oldest first
+        """
+
+        self._rebuild(messages)
+
+    def clear(self) -> None:
+        """Remove all messages from the history."""
+
+        self._history.clear()
+        self._chat_by_peer.clear()
 
     def remember(self, message: Message) -> None:
         """
         Store a message in the conversation history.
 
         This method implements the `remember` method from the `Memory` protocol.
-        It adds the provided message object to the internal history list, maintaining the maximum history length.
-        If the history reaches its limit, the oldest message is removed before adding the new one.
+        It adds the provided message object to the internal history, maintaining the maximum history length.
+        If the history reaches its limit, the oldest message is removed as the new one is added.
+        CHAT messages are also indexed by source and recipient for `chat_log_for`.
 
         Args:
             message: The message object to be stored (type: agentkit.messages.Message)
         """
 
-        if len(self.history) >= self.max_history_length:
-            self.history.pop(0)  # Remove oldest message to maintain limit
-        self.history.append(message)
+        self._store(message)
+
+    def _rebuild(self, messages: Iterable[Message]) -> None:
+        """
+        Reset the history and participant index from the given messages under the current limit.
+
+        Args:
+            messages: The messages to store, oldest first
+        """
+
+        messages = list(messages)
+        limit = self._max_history_length
+        self._history = deque(maxlen=limit if limit > 0 else None)
+        self._chat_by_peer.clear()
+        for message in messages:
+            self._store(message)
+
+    def _store(self, message: Message) -> None:
+        """
+        Append a message to the history and the participant index, evicting the oldest if full.
+
+        Args:
+            message: The message object to be stored
+        """
+
+        history = self._history
+        if history.maxlen is not None and len(history) == history.maxlen:
+            self._forget_chat(*history[0])
+
+        peers: Tuple[str, ...] = ()
+        if message.message_type == MessageType.CHAT:
+            peers = (message.source,) if message.to == message.source else (message.source, message.to)
+            for peer in peers:
+                self._chat_by_peer[peer].append(message)
+        history.append((message, peers))
+
+    def _forget_chat(self, message: Message, peers: Tuple[str, ...]) -> None:
+        """
+        Drop a message that is about to be evicted from the participant index.
+
+        The evicted message is always the oldest one in history, so it is at the front of
+        the log of every participant it was indexed under.
+
+        Args:
+            message: The message being evicted from the history
+            peers: The participants the message was indexed under when it was stored
+        """
+
+        for peer in peers:
+            log = self._chat_by_peer[peer]
+            log.popleft()
+            if not log:
+                del self._chat_by_peer[peer]
 
     def get_history(self) -> list[Message]:
         """
@@ -48,7 +151,7 @@ class SimpleMemory(BaseMemory):
             list[Message]: A list of message objects (type: agentkit.messages.Message) representing the conversation history.
         """
 
-        return self.history
+        return [message for message, _ in self._history]
 
     def get_chat_context(self, target: str, 
                          prefix: str = "", 
@@ -57,9 +160,9 @@ class SimpleMemory(BaseMemory):
         """
         Retrieve chat conversation history with a specific target (source or recipient) and format it with a prefix.
 
-        This method filters the complete history retrieved by `get_history` and returns only messages
-        where the source or recipient matches the provided `target` and the message type is `CHAT`.
-        It then formats the filtered messages with the specified `prefix` before joining them into a string.
+        This method takes the CHAT messages returned by `chat_log_for` for the provided `target`,
+        formats one line per message with the specified `prefix` and speaker name, and joins the lines
+        into a single string.
 
         Args:
             target (str): The target name (source or recipient) to filter the chat history for.
@@ -70,17 +173,21 @@ class SimpleMemory(BaseMemory):
         """
         
         chat_log = self.chat_log_for(target)
-        context = ""
+
+        # Speaker prefixes are fixed per call, except for unnamed assistants
+        user_prefix = f"{prefix}{user_role_name or target}: "
+        assistant_prefix = f"{prefix}{assistant_role_name}: " if assistant_role_name else None
+
+        lines = []
         for l in chat_log:
             if l.source == target:
                 # Speaker selection - user
-                speaker = user_role_name if user_role_name else l.source
+                speaker = user_prefix
             else:
                 # Speaker selection - assistant
-                speaker = assistant_role_name if assistant_role_name else l.source
-
-            context +=f"{prefix}{speaker}: {l.content.strip()}\n"
-        return context
+                speaker = assistant_prefix or f"{prefix}{l.source}: "
+            lines.append(f"{speaker}{l.content.strip()}\n")
+        return "".join(lines)
 
     def get_context(self) -> str:
         """ This is a dumb implementation of the context
@@ -96,5 +203,4 @@ class SimpleMemory(BaseMemory):
         Returns:
             list: A list of `Message` objects representing the chat log for the specified target.
         """
-        chat_log = [x for x in self.get_history() if (target in [x.to, x.source]) and x.message_type == MessageType.CHAT]
-        return chat_log
+        return list(self._chat_by_peer.get(target, ()))